@@ -7,7 +7,32 @@ __all__ = ["Events", "Asset", "Assets", "Contract", "Collection",
            "CollectionStats", "Collections", "Bundles", "utils",
            "OpenseaAPI"]
 
-from opensea.opensea import Events, Asset, Assets, Contract, Collection, \
-    CollectionStats, Collections, Bundles
-from opensea.opensea_api import OpenseaAPI
+import importlib
 from opensea import utils
+
+# the API classes (and `requests` with them) are only imported when they are
+# first accessed, so `import opensea` stays cheap
+_LAZY_IMPORTS = {
+    "Events": "opensea.opensea",
+    "Asset": "opensea.opensea",
+    "Assets": "opensea.opensea",
+    "Contract": "opensea.opensea",
+    "Collection": "opensea.opensea",
+    "CollectionStats": "opensea.opensea",
+    "Collections": "opensea.opensea",
+    "Bundles": "opensea.opensea",
+    "OpenseaAPI": "opensea.opensea_api",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
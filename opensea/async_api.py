@@ -0,0 +1,501 @@
+import asyncio
+import aiohttp
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from opensea import utils
+from opensea.opensea_api import (USER_AGENT, _QueryBuilder, _asset_endpoint,
+                                 _status_errors)
+
+# marks the end of a pagination queue
+_DONE = object()
+
+
+class AsyncOpenseaAPI(_QueryBuilder):
+
+    RETRY_STATUSES = (429, 504)
+
+    def __init__(self, base_url="https://api.opensea.io/api", apikey=None,
+                 version="v1", concurrency=10, max_retries=5,
+                 backoff_factor=0.5):
+        """Asyncio version of `OpenseaAPI`, built on top of `aiohttp`. Use it
+        to fetch many pages (or endpoints) concurrently.
+
+        The object has to be used as an async context manager, eg.:
+
+            async with AsyncOpenseaAPI(apikey="<APIKEY>") as api:
+                result = await api.collection("cryptopunks")
+
+        Args:
+            base_url (str): OpenSea API base URL. Defaults to
+            "https://api.opensea.io/api".
+            apikey (str): OpenSea API key (you need to request one)
+            version (str, optional): API version. Defaults to "v1".
+            concurrency (int, optional): Maximum number of requests in flight
+            at the same time. Defaults to 10.
+            max_retries (int, optional): How many times a request is retried
+            when the server responds with 429 or 504. Defaults to 5.
+            backoff_factor (float, optional): Base delay (in seconds) of the
+            exponential backoff between retries. Defaults to 0.5.
+        """
+        self.api_url = f"{base_url}/{version}"
+        self.apikey = apikey
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        headers = {"User-Agent": USER_AGENT,
+                   "Accept": "application/json"}
+        if self.apikey:
+            headers["X-API-KEY"] = self.apikey
+        self._session = aiohttp.ClientSession(
+            headers=headers,
+            connector=aiohttp.TCPConnector(limit_per_host=64),
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Closes the underlying `aiohttp` session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @staticmethod
+    def _prepare_params(params):
+        """aiohttp only accepts str, int and float query values, so `None`
+        values are dropped, lists are expanded into repeated keys and
+        booleans are sent the same way `requests` would send them.
+        """
+        prepared = []
+        for key, value in (params or {}).items():
+            if value is None:
+                continue
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for v in values:
+                prepared.append((key, str(v) if isinstance(v, bool) else v))
+        return prepared
+
+    async def _make_request(self, endpoint=None, params=None):
+        """Makes a request to the OpenSea API and returns the decoded JSON
+        data. Requests getting a 429 or 504 response are retried with an
+        exponential backoff.
+
+        Args:
+            endpoint (str, optional): API endpoint to use for the request.
+            params (dict, optional): Query parameters to include in the
+            request. Defaults to None.
+
+        Raises:
+            ValueError: returns the error message from the API in case one
+            (or more) of your request parameters are incorrect.
+            ConnectionError: your request got blocked by the server (try
+            using an API key if you keep getting this error)
+            TimeoutError: your request timed out (try rate limiting)
+            aiohttp.ClientResponseError: any other error response.
+
+        Returns:
+            [dict]: Data sent back from the API.
+        """
+        if endpoint is None:
+            raise ValueError("You need to define an `endpoint` when making a "
+                             "request!")
+        if self._session is None:
+            raise RuntimeError("AsyncOpenseaAPI must be used as an async "
+                               "context manager (`async with ...`)")
+
+        url = f"{self.api_url}/{endpoint}"
+        params = self._prepare_params(params)
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                async with self._session.get(url, params=params) as response:
+                    if (response.status not in self.RETRY_STATUSES
+                            or attempt == self.max_retries):
+                        return await self._handle_response(response)
+                await asyncio.sleep(self.backoff_factor * 2 ** attempt)
+
+    @staticmethod
+    async def _handle_response(response):
+        error = _status_errors().get(response.status)
+        if error is not None:
+            exception, message = error
+            # the messages are built from a `requests`-like response, which
+            # only needs the (already awaited) body text
+            text = await response.text()
+            raise exception(message(SimpleNamespace(text=text)))
+        response.raise_for_status()
+        return utils.json_loads(await response.read())
+
+    async def gather(self, coros):
+        """Runs the given coroutines concurrently (the number of requests in
+        flight is still capped by `concurrency`).
+
+        Args:
+            coros (iterable): Coroutines, eg. `api.assets(...)` calls.
+
+        Returns:
+            list: Results in the same order as the coroutines. A failed
+            request's exception is returned in place of its result instead of
+            being raised.
+        """
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    async def fetch_pages(self, endpoint, param_list):
+        """Requests the same endpoint with different query parameters
+        concurrently, eg. to download multiple offset-based pages at once.
+
+        Args:
+            endpoint (str): API endpoint, eg. 'collections'.
+            param_list (iterable): One dict of query parameters per request.
+
+        Returns:
+            list: Data (or exception) for each request, in the same order as
+            `param_list`.
+        """
+        return await self.gather(self._make_request(endpoint, params)
+                                 for params in param_list)
+
+    async def _paginate(self, fetch, rate_limiting, prefetch, stop=None):
+        """Follows the `next` cursors of a paginated endpoint. A background
+        task keeps downloading up to `prefetch` pages ahead, so the consumer
+        doesn't have to wait for a round trip after processing a page.
+
+        Args:
+            fetch (coroutine function): Called with a `cursor` keyword
+            argument, returns a page.
+            rate_limiting (float): Seconds to wait between requests.
+            prefetch (int): Maximum number of pages downloaded in advance.
+            stop (callable, optional): Called with every page after the
+            first one. If it returns True, the pagination ends without
+            yielding that page, before the next one is requested.
+
+        Yields:
+            dictionary: a page of data
+        """
+        queue = asyncio.Queue(maxsize=prefetch)
+
+        async def produce():
+            cursor = None
+            try:
+                while True:
+                    page = await fetch(cursor=cursor)
+                    if cursor is not None and stop is not None and stop(page):
+                        break
+                    await queue.put(page)
+                    cursor = page.get("next")
+                    if cursor is None:
+                        break
+                    await asyncio.sleep(rate_limiting)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(_DONE)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    async def events(
+        self,
+        asset_contract_address=None,
+        collection_slug=None,
+        token_id=None,
+        account_address=None,
+        event_type=None,
+        only_opensea=False,
+        auction_type=None,
+        limit=None,
+        occurred_before=None,
+        occurred_after=None,
+        collection_editor=None,
+        cursor=None,
+    ):
+        """Fetches Events data from the API. Same as `OpenseaAPI.events`.
+
+        OpenSea API Events query parameters:
+        https://docs.opensea.io/reference/retrieving-asset-events
+
+        Returns:
+            [dict]: Events data
+        """
+        query_params = self._events_query(
+            asset_contract_address=asset_contract_address,
+            collection_slug=collection_slug,
+            token_id=token_id,
+            account_address=account_address,
+            event_type=event_type,
+            only_opensea=only_opensea,
+            auction_type=auction_type,
+            collection_editor=collection_editor,
+            cursor=cursor,
+            limit=limit,
+            occurred_before=occurred_before,
+            occurred_after=occurred_after,
+        )
+        return await self._make_request("events", query_params)
+
+    async def events_backfill(self, start, until, rate_limiting=2,
+                              prefetch=4, **params):
+        """Async version of `OpenseaAPI.events_backfill`: downloads events
+        backwards from `start` until `until` is reached. Use it with
+        `async for`.
+
+        Args:
+            start (datetime): A point in time where you want to start
+            downloading data from.
+            until (datetime): How much do you want to go back in time? This
+            datetime value will provide that threshold.
+            rate_limiting (float, optional): Seconds to wait between requests.
+            Defaults to 2.
+            prefetch (int, optional): Maximum number of pages downloaded in
+            advance. Defaults to 4.
+
+            Other keyword arguments are passed to `events`.
+
+        Yields:
+            dictionary: event data
+        """
+        if not isinstance(until, datetime) or not isinstance(start, datetime):
+            raise ValueError("`until` and `start` must be datetime objects")
+
+        if until > start:
+            raise ValueError("`start` must be a later point in time than "
+                             "`until`")
+
+        async def fetch(cursor):
+            return await self.events(occurred_before=start, cursor=cursor,
+                                     **params)
+
+        # the API sends UTC timestamps in ISO format, which sort as strings
+        until_str = until.astimezone(timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S")
+
+        def reached_until(page):
+            events = page.get("asset_events")
+            return not events or events[0]["created_date"][:19] < until_str
+
+        pages = self._paginate(fetch, rate_limiting, prefetch,
+                               stop=reached_until)
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            await pages.aclose()
+
+    async def asset(self, asset_contract_address, token_id,
+                    account_address=None, include_orders=False):
+        """Fetches Asset data from the API. Same as `OpenseaAPI.asset`.
+
+        OpenSea API Asset query parameters:
+        https://docs.opensea.io/reference/retrieving-a-single-asset
+
+        Returns:
+            [dict]: Single asset data
+        """
+        endpoint = _asset_endpoint(asset_contract_address, token_id)
+        query_params = utils.compact({"account_address": account_address,
+                                      "include_orders": include_orders})
+        return await self._make_request(endpoint, query_params)
+
+    async def assets(
+        self,
+        owner=None,
+        token_ids=None,
+        asset_contract_address=None,
+        asset_contract_addresses=None,
+        order_by=None,
+        order_direction=None,
+        offset=None,
+        limit=None,
+        collection=None,
+        include_orders=False,
+        cursor=None,
+    ):
+        """Fetches assets data from the API (a single page). Same as
+        `OpenseaAPI.assets`.
+
+        OpenSea API Assets query parameters:
+        https://docs.opensea.io/reference/getting-assets
+
+        Returns:
+            [dict]: Assets data
+        """
+        query_params = utils.compact({
+            "owner": owner,
+            "token_ids": token_ids,
+            "asset_contract_address": asset_contract_address,
+            "asset_contract_addresses": asset_contract_addresses,
+            "order_by": order_by,
+            "order_direction": order_direction,
+            "offset": offset,
+            "limit": self.MAX_ASSET_ITEMS if limit is None else limit,
+            "collection": collection,
+            "include_orders": include_orders,
+            "cursor": cursor,
+        })
+        return await self._make_request("assets", query_params)
+
+    async def assets_pages(self, rate_limiting=2, prefetch=4, **params):
+        """Async version of `OpenseaAPI.assets(pagination=True)`: yields
+        every page of assets using the cursor-based pagination. Use it with
+        `async for`.
+
+        Args:
+            rate_limiting (float, optional): Seconds to wait between requests.
+            Defaults to 2.
+            prefetch (int, optional): Maximum number of pages downloaded in
+            advance. Defaults to 4.
+
+            Other keyword arguments are passed to `assets`.
+
+        Yields:
+            dictionary: a page of assets
+        """
+        async def fetch(cursor):
+            return await self.assets(cursor=cursor, **params)
+
+        pages = self._paginate(fetch, rate_limiting, prefetch)
+        try:
+            async for page in pages:
+                yield page
+        finally:
+            await pages.aclose()
+
+    async def assets_by_ids(self, token_ids, asset_contract_address=None,
+                            **params):
+        """Async version of `OpenseaAPI.assets_by_ids`: fetches the assets
+        with the given token IDs in batches of `MAX_ASSET_ITEMS`, requesting
+        the batches concurrently (capped by `concurrency`).
+
+        Args:
+            token_ids (iterable): Token IDs of the assets.
+            asset_contract_address (str, optional): Address of the contract
+            the tokens belong to.
+
+            Other keyword arguments are passed to `assets`, except `limit`
+            and `cursor`, which are set by the batching.
+
+        Returns:
+            [dict]: Assets data of every batch, as `{"assets": [...]}`.
+        """
+        for name in ("limit", "cursor"):
+            if name in params:
+                raise TypeError(f"assets_by_ids() doesn't accept `{name}`")
+        size = self.MAX_ASSET_ITEMS
+        token_ids = list(token_ids)
+        pages = await asyncio.gather(*(
+            self.assets(token_ids=token_ids[i:i + size],
+                        asset_contract_address=asset_contract_address,
+                        limit=size, **params)
+            for i in range(0, len(token_ids), size)))
+        return {"assets": [asset for page in pages
+                           for asset in page.get("assets", [])]}
+
+    async def contract(self, asset_contract_address):
+        """Fetches asset contract data from the API. Same as
+        `OpenseaAPI.contract`.
+
+        Returns:
+            [dict]: Single asset contract data
+        """
+        endpoint = f"asset_contract/{asset_contract_address}"
+        return await self._make_request(endpoint)
+
+    async def collection(self, collection_slug):
+        """Fetches collection data from the API. Same as
+        `OpenseaAPI.collection`.
+
+        Returns:
+            [dict]: Single collection data
+        """
+        return await self._make_request(f"collection/{collection_slug}")
+
+    async def collection_stats(self, collection_slug):
+        """Fetches collection stats data from the API. Same as
+        `OpenseaAPI.collection_stats`.
+
+        Returns:
+            [dict]: Collection stats
+        """
+        return await self._make_request(f"collection/{collection_slug}/stats")
+
+    async def collections(self, asset_owner=None, offset=None, limit=None):
+        """Fetches Collections data from the API. Same as
+        `OpenseaAPI.collections`.
+
+        Returns:
+            [dict]: Collections data
+        """
+        query_params = utils.compact({
+            "asset_owner": asset_owner,
+            "offset": offset,
+            "limit": self.MAX_COLLECTION_ITEMS if limit is None else limit,
+        })
+        return await self._make_request("collections", query_params)
+
+    async def bundles(
+        self,
+        on_sale=None,
+        owner=None,
+        asset_contract_address=None,
+        asset_contract_addresses=None,
+        token_ids=None,
+        limit=None,
+        offset=None,
+    ):
+        """Fetches Bundles data from the API. Same as `OpenseaAPI.bundles`.
+
+        Returns:
+            [dict]: Bundles data
+        """
+        query_params = utils.compact({
+            "on_sale": on_sale,
+            "owner": owner,
+            "asset_contract_address": asset_contract_address,
+            "asset_contract_addresses": asset_contract_addresses,
+            "token_ids": token_ids,
+            "limit": self.MAX_BUNDLE_ITEMS if limit is None else limit,
+            "offset": offset,
+        })
+        return await self._make_request("bundles", query_params)
+
+    async def listings(self, asset_contract_address, token_id, limit=None):
+        """Fetches Listings data for an asset from the API. Same as
+        `OpenseaAPI.listings`.
+
+        Returns:
+            [dict]: Listings data
+        """
+        query_params = utils.compact({
+            "limit": self.MAX_LISTING_ITEMS if limit is None else limit
+        })
+        endpoint = (_asset_endpoint(asset_contract_address, token_id)
+                    + "/listings")
+        return await self._make_request(endpoint, query_params)
+
+    async def offers(self, asset_contract_address, token_id, limit=None):
+        """Fetches Offers data for an asset from the API. Same as
+        `OpenseaAPI.offers`.
+
+        Returns:
+            [dict]: Offers data
+        """
+        query_params = utils.compact({
+            "limit": self.MAX_OFFER_ITEMS if limit is None else limit
+        })
+        endpoint = (_asset_endpoint(asset_contract_address, token_id)
+                    + "/offers")
+        return await self._make_request(endpoint, query_params)
@@ -0,0 +1,67 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+
+    def __init__(self, maxsize=4096, ttl=300):
+        """Simple in-memory LRU cache where every entry expires after `ttl`
+        seconds. Used to cache responses of rarely changing endpoints. It's
+        safe to use from multiple threads.
+
+        Any object with the same `get(key)` and `set(key, value, ttl=None)`
+        methods (eg. a wrapper around Redis) can be used instead, see the
+        `cache` argument of `OpenseaAPI`.
+
+        Args:
+            maxsize (int, optional): Maximum number of entries. The least
+            recently used entry is dropped when the cache is full.
+            Defaults to 4096.
+            ttl (int, optional): Seconds until an entry expires.
+            Defaults to 300.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Returns the value stored for `key`, or `default` if there's no
+        such entry or it's already expired.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        """Stores `value` for `key`, evicting the least recently used entry
+        if the cache is full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl (int, optional): Seconds until this entry expires. Defaults
+            to the `ttl` of the cache.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """Removes every entry from the cache."""
+        with self._lock:
+            self._data.clear()
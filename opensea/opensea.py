@@ -1,59 +1,51 @@
-import requests
-from datetime import datetime
+from functools import lru_cache
 from opensea import utils
+from opensea.opensea_api import OpenseaAPI
+
+
+@lru_cache(maxsize=None)
+def _shared_api(base_url, version):
+    """Returns the `OpenseaAPI` object (and so the HTTP session) shared by
+    every endpoint object using the same base URL and API version.
+    """
+    return OpenseaAPI(base_url=base_url, version=version, cache_ttl=None)
 
 
 class OpenseaBase:
 
+    __slots__ = ("api_url", "_api", "_endpoint")
+
     def __init__(self, endpoint, version="v1",
                  base_url="https://api.opensea.io/api"):
         """Base class to interact with the OpenSea API and fetch NFT data.
+        Requests are made through an `OpenseaAPI` object.
 
         Args:
             endpoint (str): OpenSea API endpoint, eg. 'asset' or 'collections'
             version (str, optional): API version. Defaults to "v1"
-            base
+            base_url (str, optional): OpenSea API base URL. Defaults to
+            "https://api.opensea.io/api".
         """
         self.api_url = f"{base_url}/{version}/{endpoint}"
+        self._api = _shared_api(base_url, version)
+        self._endpoint = endpoint
 
     def _make_request(self, params=None, export_file_name="",
                       return_response=False):
-        """Makes a request to the OpenSea API and returns either a response
-        object or dictionary.
-
-        Args:
-            params (dict, optional): Query parameters to include in the
-            request. Defaults to None.
-            export_file_name (str, optional): In case you want to download the
-            data into a file,
-            specify the filename here. Eg. 'export.json'. Be default, no file
-            is created.
-            return_response (bool, optional): Set it True if you want it to
-            return the actual response object.
-            By default, it's False, which means a dictionary will be returned.
-
-        Raises:
-            ValueError: returns the error message from the API in case one
-            (or more) of your request parameters are incorrect.
+        """Makes a request to the endpoint, see `OpenseaAPI._make_request`.
 
         Returns:
             Data sent back from the API. Either a response or dict object
             depending on the *return_response* argument.
         """
-        response = requests.get(self.api_url, params=params)
-        if response.status_code == 400:
-            raise ValueError(response.text)
-        elif response.status_code == 504:
-            raise TimeoutError("The server reported a gateway time-out error.")
-        if export_file_name != "":
-            utils.export_file(response.content, export_file_name)
-        if return_response:
-            return response
-        return response.json()
+        return self._api._make_request(self._endpoint, params,
+                                       export_file_name, return_response)
 
 
 class Events(OpenseaBase):
 
+    __slots__ = ()
+
     MAX_API_ITEMS = 300
 
     def __init__(self):
@@ -95,33 +87,26 @@ class Events(OpenseaBase):
         Returns:
             [dict]: Events data
         """
-        if (occurred_after is not None
-            and not isinstance(occurred_after, datetime)):
-            raise ValueError("occurred_after must be a datetime object")
-
-        if (occurred_before is not None
-            and not isinstance(occurred_before, datetime)):
-            raise ValueError("occurred_before must be a datetime object")
-
-        query_params = {
-            "asset_contract_address": asset_contract_address,
-            "collection_slug": collection_slug,
-            "token_id": token_id,
-            "account_address": account_address,
-            "event_type": event_type,
-            "only_opensea": only_opensea,
-            "auction_type": auction_type,
-            "offset": offset,
-            "limit": self.MAX_API_ITEMS if limit is None else limit,
-        }
-        if occurred_before is not None:
-            query_params["occurred_before"] = occurred_before.timestamp()
-        if occurred_after is not None:
-            query_params["occurred_after"] = occurred_after.timestamp()
+        query_params = self._api._events_query(
+            asset_contract_address=asset_contract_address,
+            collection_slug=collection_slug,
+            token_id=token_id,
+            account_address=account_address,
+            event_type=event_type,
+            only_opensea=only_opensea,
+            auction_type=auction_type,
+            offset=offset,
+            limit=self.MAX_API_ITEMS if limit is None else limit,
+            occurred_before=occurred_before,
+            occurred_after=occurred_after,
+        )
         return super()._make_request(query_params, export_file_name)
 
 
 class Asset(OpenseaBase):
+
+    __slots__ = ()
+
     def __init__(self, asset_contract_address, token_id):
         """Endpoint to fetch data about a single asset.
         More info about this endpoint in the OpenSea docs:
@@ -144,12 +129,14 @@ class Asset(OpenseaBase):
         Returns:
             [dict]: Single asset data
         """
-        query_params = {"account_address": account_address}
+        query_params = utils.compact({"account_address": account_address})
         return super()._make_request(query_params, export_file_name)
 
 
 class Assets(OpenseaBase):
 
+    __slots__ = ()
+
     MAX_API_ITEMS = 50
 
     def __init__(self):
@@ -162,7 +149,7 @@ class Assets(OpenseaBase):
     def fetch(
         self,
         owner=None,
-        token_ids=[],
+        token_ids=None,
         asset_contract_address=None,
         asset_contract_addresses=None,
         order_by=None,
@@ -185,21 +172,24 @@ class Assets(OpenseaBase):
         Returns:
             [dict]: Assets data
         """
-        query_params = {
-            "owner": owner,
-            "token_ids": token_ids,
-            "asset_contract_address": asset_contract_address,
-            "asset_contract_addresses": asset_contract_addresses,
-            "order_by": order_by,
-            "order_direction": order_direction,
-            "offset": offset,
-            "limit": self.MAX_API_ITEMS if limit is None else limit,
-            "collection": collection,
-        }
-        return super()._make_request(query_params, export_file_name)
+        return self._api.assets(
+            owner=owner,
+            token_ids=token_ids,
+            asset_contract_address=asset_contract_address,
+            asset_contract_addresses=asset_contract_addresses,
+            order_by=order_by,
+            order_direction=order_direction,
+            offset=offset,
+            limit=self.MAX_API_ITEMS if limit is None else limit,
+            collection=collection,
+            export_file_name=export_file_name,
+        )
 
 
 class Contract(OpenseaBase):
+
+    __slots__ = ()
+
     def __init__(self, asset_contract_address):
         """Endpoint to fetch data about a single asset contract.
         More info about this endpoint in the OpenSea docs:
@@ -227,6 +217,9 @@ class Contract(OpenseaBase):
 
 
 class Collection(OpenseaBase):
+
+    __slots__ = ()
+
     def __init__(self, collection_slug):
         """Endpoint to fetch data about a single asset contract.
         More info about this endpoint in the OpenSea docs:
@@ -254,6 +247,9 @@ class Collection(OpenseaBase):
 
 
 class CollectionStats(OpenseaBase):
+
+    __slots__ = ()
+
     def __init__(self, collection_slug):
         """Endpoint to fetch a single collection's stats.
         More info about this endpoint in the OpenSea docs:
@@ -282,6 +278,8 @@ class CollectionStats(OpenseaBase):
 
 class Collections(OpenseaBase):
 
+    __slots__ = ()
+
     MAX_API_ITEMS = 300
 
     def __init__(self):
@@ -307,16 +305,18 @@ class Collections(OpenseaBase):
         Returns:
             [dict]: Collections data
         """
-        query_params = {
-            "asset_owner": asset_owner,
-            "offset": offset,
-            "limit": self.MAX_API_ITEMS if limit is None else limit,
-        }
-        return super()._make_request(query_params, export_file_name)
+        return self._api.collections(
+            asset_owner=asset_owner,
+            offset=offset,
+            limit=self.MAX_API_ITEMS if limit is None else limit,
+            export_file_name=export_file_name,
+        )
 
 
 class Bundles(OpenseaBase):
 
+    __slots__ = ()
+
     MAX_API_ITEMS = 50
 
     def __init__(self):
@@ -327,8 +327,8 @@ class Bundles(OpenseaBase):
         on_sale=None,
         owner=None,
         asset_contract_address=None,
-        asset_contract_addresses=[],
-        token_ids=[],
+        asset_contract_addresses=None,
+        token_ids=None,
         limit=None,
         export_file_name="",
         offset=None,
@@ -347,13 +347,13 @@ class Bundles(OpenseaBase):
         Returns:
             [dict]: Bundles data
         """
-        query_params = {
-            "on_sale": on_sale,
-            "owner": owner,
-            "asset_contract_address": asset_contract_address,
-            "asset_contract_addresses": asset_contract_addresses,
-            "token_ids": token_ids,
-            "limit": self.MAX_API_ITEMS if limit is None else limit,
-            "offset": offset,
-        }
-        return super()._make_request(query_params, export_file_name)
+        return self._api.bundles(
+            on_sale=on_sale,
+            owner=owner,
+            asset_contract_address=asset_contract_address,
+            asset_contract_addresses=asset_contract_addresses,
+            token_ids=token_ids,
+            limit=self.MAX_API_ITEMS if limit is None else limit,
+            export_file_name=export_file_name,
+            offset=offset,
+        )
@@ -1,10 +1,137 @@
 import time
-import requests
-from datetime import datetime
-from opensea import utils
-
-
-class OpenseaAPI:
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from datetime import datetime, timezone
+from opensea import __version__, utils
+from opensea.cache import TTLCache
+
+USER_AGENT = f"python-opensea/{__version__}"
+
+
+@lru_cache(maxsize=None)
+def _status_errors():
+    """Exception class and message factory for the error status codes. Built
+    on first use, so `requests` is only imported once it's actually needed.
+    """
+    import requests
+    return {
+        400: (ValueError, lambda r: r.text),
+        401: (requests.exceptions.HTTPError, lambda r: r.text),
+        403: (ConnectionError, lambda r: "The server blocked access."),
+        429: (ConnectionError,
+              lambda r: "The server kept rate limiting the requests."),
+        495: (requests.exceptions.SSLError,
+              lambda r: "SSL certificate error"),
+        504: (TimeoutError,
+              lambda r: "The server reported a gateway time-out error."),
+    }
+
+
+def _new_session(apikey=None):
+    """Creates a `requests.Session` with a pooled adapter mounted on it, so
+    consecutive requests to the API reuse the same (keep-alive) connection
+    instead of doing a new TCP and TLS handshake every time.
+
+    JSON responses are requested explicitly. Compressed responses are
+    accepted by `requests` already, including brotli if the `brotli` package
+    is installed.
+
+    Connection errors, read errors and transient server error (5xx)
+    responses are retried with an exponential backoff, on the same pooled
+    connection when possible. If every retry fails, the last response is
+    returned so the usual error handling applies. Rate limited (429)
+    responses are left to `OpenseaAPI`, which adapts its pace to them.
+
+    Args:
+        apikey (str, optional): OpenSea API key. If provided, it's sent
+        with every request made through this session.
+
+    Returns:
+        requests.Session
+    """
+    # imported here so that importing this module doesn't pull in requests
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept": "application/json",
+    })
+    if apikey:
+        session.headers.update({"X-API-KEY": apikey})
+    retry = Retry(
+        total=5,
+        connect=3,
+        read=3,
+        status=5,
+        backoff_factor=0.4,
+        status_forcelist=frozenset((500, 502, 503, 504)),
+        allowed_methods=frozenset(("GET",)),
+        # urllib3 would retry 429 responses too if this was enabled
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    # every request goes to the same host, so a single (bigger) pool is enough
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32,
+                          max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _new_http2_client(apikey=None):
+    """Creates an `httpx.Client` speaking HTTP/2, so concurrent requests
+    (eg. `paginate` prefetching) are multiplexed over a single connection.
+
+    Unlike the `requests` session, it doesn't retry 5xx responses.
+
+    Args:
+        apikey (str, optional): OpenSea API key. If provided, it's sent
+        with every request made through this client.
+
+    Returns:
+        httpx.Client
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("HTTP/2 support requires httpx, install it with "
+                          "`pip install opensea-api[http2]`") from None
+    headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+    if apikey:
+        headers["X-API-KEY"] = apikey
+    return httpx.Client(
+        http2=True,
+        headers=headers,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    )
+
+
+def _httpx_params(params):
+    """httpx encodes booleans as `true`/`false`, so they are converted to the
+    `True`/`False` strings `requests` would send, keeping the query string the
+    same whichever client is used.
+    """
+    if not params:
+        return params
+    return {key: str(value) if isinstance(value, bool) else value
+            for key, value in params.items()}
+
+
+@lru_cache(maxsize=1024)
+def _asset_endpoint(asset_contract_address, token_id):
+    return f"asset/{asset_contract_address}/{token_id}"
+
+
+class _QueryBuilder:
+    """Page size limits and query parameter building shared by `OpenseaAPI`
+    and `AsyncOpenseaAPI`, so both clients send the same requests.
+    """
+
+    __slots__ = ()
 
     MAX_EVENT_ITEMS = 300
     MAX_ASSET_ITEMS = 50
@@ -13,8 +140,45 @@ class OpenseaAPI:
     MAX_LISTING_ITEMS = 50
     MAX_OFFER_ITEMS = 50
 
+    def _events_query(self, limit=None, occurred_before=None,
+                      occurred_after=None, **params):
+        """Builds the query parameters of the `events` endpoint. Also used by
+        the `Events` endpoint class.
+
+        Returns:
+            dict: Query parameters
+        """
+        query_params = utils.compact(params)
+        query_params["limit"] = (self.MAX_EVENT_ITEMS if limit is None
+                                 else limit)
+        for key, value in (("occurred_before", occurred_before),
+                           ("occurred_after", occurred_after)):
+            if value is not None:
+                try:
+                    query_params[key] = int(value.timestamp())
+                except AttributeError:
+                    raise ValueError(
+                        f"`{key}` must be a datetime object") from None
+        return query_params
+
+
+class OpenseaAPI(_QueryBuilder):
+
+    __slots__ = ("api_url", "apikey", "timeout", "_api_url_slash",
+                 "_session", "_http2", "_cache", "_cache_ttl", "_rate")
+
+    # how many times a rate limited (429) request is retried
+    MAX_RATE_LIMIT_RETRIES = 5
+
+    # seconds to cache the responses of these endpoints for, the other
+    # cached endpoints use `cache_ttl`
+    ASSET_CACHE_TTL = 3600
+    CONTRACT_CACHE_TTL = 3600
+    COLLECTION_STATS_CACHE_TTL = 60
+
     def __init__(self, base_url="https://api.opensea.io/api", apikey=None,
-                 version="v1"):
+                 version="v1", cache_ttl=300, cache_size=4096, http2=False,
+                 timeout=30, cache=None):
         """Base class to interact with the OpenSea API and fetch NFT data.
 
         Args:
@@ -22,12 +186,73 @@ class OpenseaAPI:
             "https://api.opensea.io/api".
             apikey (str): OpenSea API key (you need to request one)
             version (str, optional): API version. Defaults to "v1".
+            cache_ttl (int, optional): Seconds to cache the responses of the
+            rarely changing endpoints (`asset`, `contract`, `collection`,
+            `collection_stats`) for. `asset` and `contract` responses are
+            kept for `ASSET_CACHE_TTL` and `CONTRACT_CACHE_TTL` (1 hour),
+            `collection_stats` for `COLLECTION_STATS_CACHE_TTL` (1 minute).
+            Set it to 0 or None to disable caching. Defaults to 300.
+            cache_size (int, optional): Maximum number of cached responses.
+            Defaults to 4096.
+            http2 (bool, optional): Make the requests over HTTP/2 with `httpx`
+            (needs the `http2` extra) instead of `requests`. Defaults to False.
+            timeout (float, optional): Seconds to wait for the server to
+            respond. Defaults to 30.
+            cache (object, optional): Cache to use instead of the built-in
+            in-memory one, eg. to share responses between processes. It needs
+            a `get(key)` method returning None for missing keys and a
+            `set(key, value, ttl)` method, like `opensea.cache.TTLCache`.
+            The stored values are the raw (bytes) JSON response bodies. If it
+            has a `clear()` method too, `clear_cache()` calls it. `cache_ttl`
+            still has to be set for caching to be enabled.
         """
         self.api_url = f"{base_url}/{version}"
+        # prefix of every request URL, only the endpoint is appended to it
+        self._api_url_slash = self.api_url + "/"
         self.apikey = apikey
+        self.timeout = timeout
+        self._http2 = http2
+        self._session = (_new_http2_client(apikey) if http2
+                         else _new_session(apikey))
+        self._cache_ttl = cache_ttl
+        if not cache_ttl:
+            self._cache = None
+        elif cache is not None:
+            self._cache = cache
+        else:
+            self._cache = TTLCache(cache_size, cache_ttl)
+        self._rate = utils.RateController()
+
+    @property
+    def session(self):
+        """The underlying HTTP session (a `requests.Session`, or an
+        `httpx.Client` when `http2` is enabled) reused for every request.
+        """
+        return self._session
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Closes the underlying HTTP session and frees up its pooled
+        connections. The object can be used as a context manager too, in
+        which case this is called automatically on exit.
+        """
+        self._session.close()
+
+    def clear_cache(self):
+        """Removes every cached response. Does nothing if a custom `cache`
+        without a `clear()` method is used.
+        """
+        clear = getattr(self._cache, "clear", None)
+        if clear is not None:
+            clear()
 
     def _make_request(self, endpoint=None, params=None, export_file_name="",
-                      return_response=False):
+                      return_response=False, cache=False):
         """Makes a request to the OpenSea API and returns either a response
         object or dictionary.
 
@@ -42,6 +267,10 @@ class OpenseaAPI:
             return_response (bool, optional): Set it True if you want it to
             return the actual response object.
             By default, it's False, which means a dictionary will be returned.
+            cache (bool or int, optional): Whether the response can be served
+            from (and stored in) the response cache. Pass a number of seconds
+            to use a different expiry than the default `cache_ttl`. Ignored if
+            `export_file_name` or `return_response` is set. Defaults to False.
             next_url (str, optional): If you want to paginate, provide the
             `next` value here (this is a URL) OpenSea provides in the response.
             If this argument is provided, `endpoint` will be ignored.
@@ -63,26 +292,108 @@ class OpenseaAPI:
                 """You need to define an `endpoint` when
                              making a request!"""
             )
-
-        headers = {"X-API-KEY": self.apikey}
-        url = f"{self.api_url}/{endpoint}"
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 400:
-            raise ValueError(response.text)
-        elif response.status_code == 401:
-            raise requests.exceptions.HTTPError(response.text)
-        elif response.status_code == 403:
-            raise ConnectionError("The server blocked access.")
-        elif response.status_code == 495:
-            raise requests.exceptions.SSLError("SSL certificate error")
-        elif response.status_code == 504:
-            raise TimeoutError("The server reported a gateway time-out error.")
-
+        if export_file_name == "" and not return_response:
+            return self._get_json(endpoint, params, cache)
+        if not return_response:
+            return self._download(endpoint, params, export_file_name)
+
+        response = self._get(endpoint, params)
+        if response.status_code >= 400:
+            self._raise_for_status(response)
         if export_file_name != "":
             utils.export_file(response.content, export_file_name)
-        if return_response:
-            return response
-        return response.json()
+        return response
+
+    def _download(self, endpoint, params, export_file_name):
+        """Streams the response body straight into the export file while it
+        downloads, then returns the decoded data.
+        """
+        response = self._get(endpoint, params, stream=True)
+        try:
+            if response.status_code >= 400:
+                if self._http2:
+                    response.read()
+                self._raise_for_status(response)
+            if self._http2:
+                utils.export_stream(response.iter_bytes(1 << 20),
+                                    export_file_name)
+            else:
+                # let urllib3 undo the gzip/brotli content encoding
+                response.raw.decode_content = True
+                utils.export_file_streaming(response.raw, export_file_name)
+        finally:
+            response.close()
+        return utils.load_json_file(export_file_name)
+
+    def _get(self, endpoint, params=None, stream=False):
+        """Sends a GET request to the endpoint and returns the response.
+        Rate limited (429) requests are retried after the backoff suggested
+        by the rate controller, which also records the rate limit headers of
+        every response.
+        """
+        url = self._api_url_slash + endpoint
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            if self._http2:
+                request = self._session.build_request(
+                    "GET", url, params=_httpx_params(params),
+                    timeout=self.timeout)
+                response = self._session.send(request, stream=stream)
+            else:
+                response = self._session.get(url, params=params,
+                                             stream=stream,
+                                             timeout=self.timeout)
+            self._rate.update(response)
+            if (response.status_code != 429
+                    or attempt == self.MAX_RATE_LIMIT_RETRIES):
+                return response
+            response.close()
+            time.sleep(self._rate.backoff())
+
+    def _get_json(self, endpoint, params=None, cache=False):
+        """Fast path of `_make_request` for the common case (no export file,
+        no response object): requests the endpoint and returns the decoded
+        data. Used directly by the pagination loops.
+
+        Args:
+            endpoint (str): API endpoint to use for the request.
+            params (dict, optional): Query parameters to include in the
+            request. Defaults to None.
+            cache (bool or int, optional): Whether the response can be served
+            from (and stored in) the response cache, or the number of seconds
+            to cache it for. Defaults to False.
+
+        Returns:
+            [dict]: Data sent back from the API.
+        """
+        use_cache = cache and self._cache is not None
+        if use_cache:
+            key = (endpoint, tuple(sorted((params or {}).items())))
+            # the raw body is cached and decoded on every hit, so callers
+            # always get their own copy of the data
+            content = self._cache.get(key)
+            if content is not None:
+                return utils.json_loads(content)
+
+        response = self._get(endpoint, params)
+        if response.status_code >= 400:
+            self._raise_for_status(response)
+        content = response.content
+        cache_control = response.headers.get("Cache-Control", "")
+        if (use_cache and response.status_code == 200
+                and "no-store" not in cache_control):
+            self._cache.set(key, content,
+                            self._cache_ttl if cache is True else cache)
+        return utils.json_loads(content)
+
+    @staticmethod
+    def _raise_for_status(response):
+        """Raises the exception matching an error response (see the errors
+        documented in `_make_request`).
+        """
+        error = _status_errors().get(response.status_code)
+        if error is not None:
+            exception, message = error
+            raise exception(message(response))
 
     def events(
         self,
@@ -116,30 +427,19 @@ class OpenseaAPI:
         Returns:
             [dict]: Events data
         """
-        if occurred_before is not None and not isinstance(occurred_before,
-                                                          datetime):
-            raise ValueError("`occurred_before` must be a datetime object")
-
-        if occurred_after is not None and not isinstance(occurred_after,
-                                                         datetime):
-            raise ValueError("`occurred_after` must be a datetime object")
-
-        query_params = {
-            "asset_contract_address": asset_contract_address,
-            "collection_slug": collection_slug,
-            "token_id": token_id,
-            "account_address": account_address,
-            "event_type": event_type,
-            "only_opensea": only_opensea,
-            "auction_type": auction_type,
-            "collection_editor": collection_editor,
-            "limit": self.MAX_EVENT_ITEMS if limit is None else limit,
-        }
-        if occurred_before is not None:
-            query_params["occurred_before"] = occurred_before.timestamp()
-
-        if occurred_after is not None:
-            query_params["occurred_after"] = occurred_after.timestamp()
+        query_params = self._events_query(
+            asset_contract_address=asset_contract_address,
+            collection_slug=collection_slug,
+            token_id=token_id,
+            account_address=account_address,
+            event_type=event_type,
+            only_opensea=only_opensea,
+            auction_type=auction_type,
+            collection_editor=collection_editor,
+            limit=limit,
+            occurred_before=occurred_before,
+            occurred_after=occurred_after,
+        )
         return self._make_request("events", query_params, export_file_name)
 
     def events_backfill(
@@ -175,8 +475,10 @@ class OpenseaAPI:
             until (datetime): How much data do you want?
             How much do you want to go back in time? This datetime value will
             provide that threshold.
-            rate_limiting (int, optional): Seconds to wait between requests.
-            Defaults to 2.
+            rate_limiting (int, optional): Seconds to wait between requests
+            when the API doesn't report its rate limit state. Otherwise the
+            wait adapts to the remaining quota. The time spent processing a
+            page counts towards the wait. Defaults to 2.
 
             Other parameters are available (all of the `events` endpoint
             parameters) and they are documented in the OpenSea docs
@@ -194,7 +496,7 @@ class OpenseaAPI:
                              than `until`"""
             )
 
-        query_params = {
+        query_params = utils.compact({
             "asset_contract_address": asset_contract_address,
             "collection_slug": collection_slug,
             "token_id": token_id,
@@ -203,30 +505,39 @@ class OpenseaAPI:
             "only_opensea": only_opensea,
             "auction_type": auction_type,
             "limit": self.MAX_EVENT_ITEMS if limit is None else limit,
-            "occurred_before": start,
+            "occurred_before": int(start.timestamp()),
             "collection_editor": collection_editor,
-        }
+        })
+
+        # the API sends UTC timestamps in ISO format, which sort as strings
+        until_str = until.astimezone(timezone.utc).strftime(
+            "%Y-%m-%dT%H:%M:%S")
+
+        get_events = itemgetter("asset_events")
+        get_next = itemgetter("next")
+        next_wait = self._rate.wait_before_next
 
         # make the first request to get the `next` cursor value
-        first_request = self._make_request("events", query_params)
+        first_request = self._get_json("events", query_params)
+        # the wait starts when a page arrives, so the time spent processing
+        # it counts towards the wait instead of adding to it
+        deadline = time.monotonic() + next_wait(rate_limiting)
         yield first_request
-        query_params["cursor"] = first_request["next"]
+        query_params["cursor"] = get_next(first_request)
 
-        # paginate
-        while True:
-            time.sleep(rate_limiting)
-            data = self._make_request("events", query_params)
+        # paginate until `until` is reached or there are no more pages
+        while query_params["cursor"] is not None:
+            time.sleep(max(0, deadline - time.monotonic()))
+            data = self._get_json("events", query_params)
+            deadline = time.monotonic() + next_wait(rate_limiting)
 
-            # update the `next` parameter for the upcoming request
-            query_params["cursor"] = data["next"]
+            events = get_events(data)
+            if not events or events[0]["created_date"][:19] < until_str:
+                return
+            yield data
 
-            time_field = data["asset_events"][0]["created_date"]
-            current_time = utils.str_to_datetime_utc(time_field)
-            if current_time >= until:
-                yield data
-            else:
-                break
-        yield None
+            # update the `next` parameter for the upcoming request
+            query_params["cursor"] = get_next(data)
 
     def asset(
         self,
@@ -234,6 +545,7 @@ class OpenseaAPI:
         token_id,
         account_address=None,
         include_orders=False,
+        force_update=False,
         export_file_name="",
     ):
         """Fetches Asset data from the API.
@@ -243,21 +555,27 @@ class OpenseaAPI:
             https://docs.opensea.io/reference/retrieving-a-single-asset
 
             Extra args:
+            force_update (bool, optional): Asks OpenSea to refresh the asset's
+            metadata and bypasses the response cache. Defaults to False.
             export_file_name (str, optional): Exports the JSON data into a the
             specified file.
 
         Returns:
             [dict]: Single asset data
         """
-        endpoint = f"asset/{asset_contract_address}/{token_id}"
-        query_params = {"account_address": account_address,
-                        "include_orders": include_orders}
-        return self._make_request(endpoint, query_params, export_file_name)
+        endpoint = _asset_endpoint(asset_contract_address, token_id)
+        query_params = utils.compact({"account_address": account_address,
+                                      "include_orders": include_orders})
+        if force_update:
+            query_params["force_update"] = True
+        return self._make_request(
+            endpoint, query_params, export_file_name,
+            cache=False if force_update else self.ASSET_CACHE_TTL)
 
     def assets(
         self,
         owner=None,
-        token_ids=[],
+        token_ids=None,
         asset_contract_address=None,
         asset_contract_addresses=None,
         order_by=None,
@@ -281,14 +599,17 @@ class OpenseaAPI:
         page of assets, or all of them. If it's `True` it will use the
         cursor-based pagination provided by OpenSea. Defaults to False.
         rate_limiting (int, optional): Only relevant if pagination is `True`.
-        It applies a rate limitation in-between requests. Defaults to 2 sec.
+        It applies a rate limitation in-between requests when the API doesn't
+        report its rate limit state (otherwise the wait adapts to the
+        remaining quota). Defaults to 2 sec.
         export_file_name (str, optional): Exports the JSON data into the
         specified file. If pagination is `True` this argument is ignored.
 
         Returns:
-            [dict]: Assets data
+            [dict]: Assets data. If pagination is `True`, a generator yielding
+            each page instead.
         """
-        query_params = {
+        query_params = utils.compact({
             "owner": owner,
             "token_ids": token_ids,
             "asset_contract_address": asset_contract_address,
@@ -299,24 +620,65 @@ class OpenseaAPI:
             "limit": self.MAX_ASSET_ITEMS if limit is None else limit,
             "collection": collection,
             "include_orders": include_orders
-        }
+        })
         if pagination:
-            # make the first request to get the `next` cursor value
-            first_request = self._make_request("assets", query_params)
-            yield first_request
-            query_params["cursor"] = first_request.get("next")
+            return self._paginate_assets(query_params, rate_limiting)
+        return self._make_request("assets", query_params, export_file_name)
 
-            # paginate
-            while True:
-                time.sleep(rate_limiting)
-                if query_params["cursor"] is not None:
-                    response = self._make_request("assets", query_params)
-                    yield response
-                    query_params["cursor"] = response.get("next")
-                else:
-                    break  # stop pagination if there is no next page
-        else:
-            return self._make_request("assets", query_params, export_file_name)
+    def _paginate_assets(self, query_params, rate_limiting):
+        """Generator behind `assets(pagination=True)`, yields every page."""
+        # make the first request to get the `next` cursor value
+        first_request = self._get_json("assets", query_params)
+        yield first_request
+        query_params["cursor"] = first_request.get("next")
+
+        # paginate
+        while True:
+            time.sleep(self._rate.wait_before_next(rate_limiting))
+            if query_params["cursor"] is not None:
+                response = self._get_json("assets", query_params)
+                yield response
+                query_params["cursor"] = response.get("next")
+            else:
+                break  # stop pagination if there is no next page
+
+    def assets_by_ids(self, token_ids, asset_contract_address=None,
+                      max_workers=8, **params):
+        """Fetches the assets with the given token IDs. The IDs are split into
+        batches of `MAX_ASSET_ITEMS` (the most the `assets` endpoint returns
+        at once) and the batches are downloaded concurrently.
+
+        Args:
+            token_ids (iterable): Token IDs of the assets.
+            asset_contract_address (str, optional): Address of the contract
+            the tokens belong to.
+            max_workers (int, optional): Maximum number of batches downloaded
+            at the same time. Defaults to 8.
+
+            Other keyword arguments are passed to `assets`, except `limit`,
+            `pagination` and `export_file_name`, which are set by the
+            batching.
+
+        Returns:
+            [dict]: Assets data of every batch, as `{"assets": [...]}`.
+        """
+        for name in ("limit", "pagination", "export_file_name"):
+            if name in params:
+                raise TypeError(f"assets_by_ids() doesn't accept `{name}`")
+        size = self.MAX_ASSET_ITEMS
+        token_ids = list(token_ids)
+        batches = [token_ids[i:i + size]
+                   for i in range(0, len(token_ids), size)]
+
+        def fetch(batch):
+            return self.assets(token_ids=batch,
+                               asset_contract_address=asset_contract_address,
+                               limit=size, **params)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = list(executor.map(fetch, batches))
+        return {"assets": [asset for page in pages
+                           for asset in page.get("assets", [])]}
 
     def contract(self, asset_contract_address, export_file_name=""):
         """Fetches asset contract data from the API.
@@ -333,7 +695,8 @@ class OpenseaAPI:
             [dict]: Single asset contract data
         """
         endpoint = f"asset_contract/{asset_contract_address}"
-        return self._make_request(endpoint, export_file_name=export_file_name)
+        return self._make_request(endpoint, export_file_name=export_file_name,
+                                  cache=self.CONTRACT_CACHE_TTL)
 
     def collection(self, collection_slug, export_file_name=""):
         """Fetches collection data from the API.
@@ -350,7 +713,8 @@ class OpenseaAPI:
             [dict]: Single collection data
         """
         endpoint = f"collection/{collection_slug}"
-        return self._make_request(endpoint, export_file_name=export_file_name)
+        return self._make_request(endpoint, export_file_name=export_file_name,
+                                  cache=True)
 
     def collection_stats(self, collection_slug, export_file_name=""):
         """Fetches collection stats data from the API.
@@ -366,7 +730,8 @@ class OpenseaAPI:
             [dict]: Collection stats
         """
         endpoint = f"collection/{collection_slug}/stats"
-        return self._make_request(endpoint, export_file_name=export_file_name)
+        return self._make_request(endpoint, export_file_name=export_file_name,
+                                  cache=self.COLLECTION_STATS_CACHE_TTL)
 
     def collections(
         self, asset_owner=None, offset=None, limit=None, export_file_name=""
@@ -385,11 +750,11 @@ class OpenseaAPI:
         Returns:
             [dict]: Collections data
         """
-        query_params = {
+        query_params = utils.compact({
             "asset_owner": asset_owner,
             "offset": offset,
             "limit": self.MAX_COLLECTION_ITEMS if limit is None else limit,
-        }
+        })
         return self._make_request("collections", query_params,
                                   export_file_name)
 
@@ -398,8 +763,8 @@ class OpenseaAPI:
         on_sale=None,
         owner=None,
         asset_contract_address=None,
-        asset_contract_addresses=[],
-        token_ids=[],
+        asset_contract_addresses=None,
+        token_ids=None,
         limit=None,
         export_file_name="",
         offset=None,
@@ -418,7 +783,7 @@ class OpenseaAPI:
         Returns:
             [dict]: Bundles data
         """
-        query_params = {
+        query_params = utils.compact({
             "on_sale": on_sale,
             "owner": owner,
             "asset_contract_address": asset_contract_address,
@@ -426,7 +791,7 @@ class OpenseaAPI:
             "token_ids": token_ids,
             "limit": self.MAX_BUNDLE_ITEMS if limit is None else limit,
             "offset": offset,
-        }
+        })
         return self._make_request("bundles", query_params, export_file_name)
 
     def listings(
@@ -445,10 +810,11 @@ class OpenseaAPI:
         Returns:
             [dict]: Listings data
         """
-        query_params = {
+        query_params = utils.compact({
             "limit": self.MAX_LISTING_ITEMS if limit is None else limit
-        }
-        endpoint = f"asset/{asset_contract_address}/{token_id}/listings"
+        })
+        endpoint = (_asset_endpoint(asset_contract_address, token_id)
+                    + "/listings")
         return self._make_request(endpoint, query_params, export_file_name)
 
     def offers(self, asset_contract_address, token_id, limit=None,
@@ -466,8 +832,60 @@ class OpenseaAPI:
         Returns:
             [dict]: Offers data
         """
-        query_params = {
+        query_params = utils.compact({
             "limit": self.MAX_OFFER_ITEMS if limit is None else limit
-        }
-        endpoint = f"asset/{asset_contract_address}/{token_id}/offers"
+        })
+        endpoint = (_asset_endpoint(asset_contract_address, token_id)
+                    + "/offers")
         return self._make_request(endpoint, query_params, export_file_name)
+
+    def paginate(self, kind, page_size=None, start=0, **params):
+        """Paginates an offset-based endpoint (`assets`, `collections` or
+        `bundles`) and yields every page. While you process a page, the next
+        one is already being downloaded in a background thread.
+
+        Args:
+            kind (str): Name of the endpoint method: 'assets', 'collections'
+            or 'bundles'.
+            page_size (int, optional): Number of items per page. Defaults to
+            the maximum the endpoint allows.
+            start (int, optional): Offset of the first page. Defaults to 0.
+
+            Other keyword arguments are passed to the endpoint method, except
+            `offset`, `limit`, `pagination` and `export_file_name`, which are
+            set by the pagination.
+
+        Yields:
+            dictionary: a page of data, until a page shorter than
+            `page_size` is reached
+        """
+        max_items = {
+            "assets": self.MAX_ASSET_ITEMS,
+            "collections": self.MAX_COLLECTION_ITEMS,
+            "bundles": self.MAX_BUNDLE_ITEMS,
+        }
+        if kind not in max_items:
+            raise ValueError("`kind` must be one of 'assets', 'collections' "
+                             "or 'bundles'")
+        for name in ("offset", "limit", "pagination", "export_file_name"):
+            if name in params:
+                raise TypeError(f"paginate() doesn't accept `{name}`")
+        if page_size is None:
+            page_size = max_items[kind]
+        elif page_size <= 0:
+            raise ValueError("`page_size` must be a positive number")
+
+        fetch = getattr(self, kind)
+        offset = start
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(fetch, offset=offset, limit=page_size,
+                                     **params)
+            while True:
+                page = future.result()
+                if len(page.get(kind, [])) < page_size:
+                    yield page
+                    break  # last page, nothing to prefetch
+                offset += page_size
+                future = executor.submit(fetch, offset=offset,
+                                         limit=page_size, **params)
+                yield page
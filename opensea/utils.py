@@ -1,4 +1,40 @@
+import json
+import shutil
+import threading
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
+
+__all__ = [
+    "json_loads", "json_dumps", "export_file", "export_stream",
+    "export_file_streaming", "load_json_file", "compact",
+    "str_to_datetime_utc", "datetime_utc", "RateController",
+]
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib
+    orjson = None
+
+if orjson is not None:
+    json_loads = orjson.loads
+else:
+    json_loads = json.loads
+
+
+def json_dumps(obj):
+    """Serializes an object into indented JSON bytes (using orjson if it's
+    installed).
+
+    Args:
+        obj (dict or list): Data to serialize.
+
+    Returns:
+        bytes: JSON data.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
 
 def export_file(content, file_name):
@@ -6,15 +42,77 @@ def export_file(content, file_name):
     already exists, overwrites it.
 
     Args:
-        content (str or bytes): Content to be inserted into the file.
+        content (str, bytes, dict or list): Content to be inserted into the
+        file. Dicts and lists are written as JSON.
         file_name (str): Name of the file to be created. Eg. 'export.json'.
     """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    elif not isinstance(content, (bytes, bytearray)):
+        content = json_dumps(content)
     with open(file_name, "wb") as f:
         f.write(content)
 
 
+def export_stream(chunks, file_name):
+    """Writes the chunks of a streamed response body into a new file as they
+    arrive, so the whole content never has to be held in memory. If the file
+    already exists, overwrites it.
+
+    Args:
+        chunks (iterable): Bytes chunks, eg. `response.iter_content()`.
+        file_name (str): Name of the file to be created. Eg. 'export.json'.
+    """
+    with open(file_name, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+def export_file_streaming(raw, file_name, chunk_size=1 << 20):
+    """Copies a file-like response body (eg. `response.raw` of a streamed
+    `requests` response) into a new file, reading at most `chunk_size` bytes
+    at a time. If the file already exists, overwrites it.
+
+    Args:
+        raw (file-like): Readable binary stream of the response body.
+        file_name (str): Name of the file to be created. Eg. 'export.json'.
+        chunk_size (int, optional): Bytes to copy at once. Defaults to 1MiB.
+    """
+    with open(file_name, "wb") as f:
+        shutil.copyfileobj(raw, f, length=chunk_size)
+
+
+def load_json_file(file_name):
+    """Reads and decodes a JSON file.
+
+    Args:
+        file_name (str): Name of the file. Eg. 'export.json'.
+
+    Returns:
+        Decoded JSON data.
+    """
+    with open(file_name, "rb") as f:
+        return json_loads(f.read())
+
+
+def compact(params):
+    """Drops the query parameters that are not set (`None`, empty list or
+    empty string), so they don't need to be encoded into the request URL.
+
+    Args:
+        params (dict): Query parameters.
+
+    Returns:
+        dict: Query parameters that have a value.
+    """
+    return {k: v for k, v in params.items()
+            if v is not None and v != [] and v != ""}
+
+
+@lru_cache(maxsize=8192)
 def str_to_datetime_utc(str):
-    """Converts a string into UTC datetime object.
+    """Converts a string into UTC datetime object. Results are cached, as the
+    same timestamps tend to be parsed over and over.
 
     Args:
         str (str): String timestamp.
@@ -22,6 +120,22 @@ def str_to_datetime_utc(str):
     Returns:
         datetime: Datetime object.
     """
+    # fast path for the "YYYY-MM-DDTHH:MM:SS[.fff[fff]]" format of the API,
+    # anything else (or anything malformed) is left to `fromisoformat`
+    if (len(str) in (19, 23, 26) and str[4] == str[7] == "-"
+            and str[10] in "T " and str[13] == str[16] == ":"
+            and (len(str) == 19 or str[19] == ".")):
+        digits = (str[0:4] + str[5:7] + str[8:10] + str[11:13] + str[14:16]
+                  + str[17:19] + str[20:])
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(int(str[0:4]), int(str[5:7]),
+                                int(str[8:10]), int(str[11:13]),
+                                int(str[14:16]), int(str[17:19]),
+                                int(str[20:].ljust(6, "0")) if str[20:] else 0,
+                                timezone.utc)
+            except ValueError:  # out of range, eg. month 13
+                pass
     return datetime.fromisoformat(str).replace(tzinfo=timezone.utc)
 
 
@@ -39,3 +153,104 @@ def datetime_utc(year, month, day, hour, minute):
         datetime
     """
     return datetime(year, month, day, hour, minute, tzinfo=timezone.utc)
+
+
+class RateController:
+
+    def __init__(self, max_backoff=60, low_remaining=5, max_wait=60):
+        """Adaptive client-side rate limiting. Keeps track of the rate limit
+        headers (`X-RateLimit-Remaining`, `X-RateLimit-Reset`, `Retry-After`)
+        and the 429 responses sent back by the API, and tells how long to
+        wait before the next request. It's safe to share between threads.
+
+        Args:
+            max_backoff (float, optional): Maximum seconds to wait after a
+            429 response. Defaults to 60.
+            low_remaining (int, optional): Below this many remaining requests
+            the waits get longer, spreading the remaining quota until it
+            resets. Defaults to 5.
+            max_wait (float, optional): Maximum seconds to wait between the
+            requests of a pagination loop while the quota runs low.
+            Defaults to 60.
+        """
+        self.max_backoff = max_backoff
+        self.low_remaining = low_remaining
+        self.max_wait = max_wait
+        self.remaining = None
+        self.reset_at = None
+        self.retry_after = 0
+        self.throttled = 0  # number of 429 responses in a row
+        self._lock = threading.RLock()
+
+    def update(self, response):
+        """Records the rate limit state reported by a response.
+
+        Args:
+            response: `requests` or `httpx` response object.
+        """
+        headers = response.headers
+        remaining = _header_number(headers, "X-RateLimit-Remaining")
+        reset = _header_number(headers, "X-RateLimit-Reset")
+        if reset is not None:
+            # either a UNIX timestamp (in seconds or milliseconds) or the
+            # seconds left until the reset
+            if reset > 1e12:
+                reset = reset / 1000 - time.time()
+            elif reset > 1e9:
+                reset -= time.time()
+            reset = time.monotonic() + max(reset, 0)
+        retry_after = _header_number(headers, "Retry-After") or 0
+        with self._lock:
+            if remaining is not None:
+                self.remaining = remaining
+            if reset is not None:
+                self.reset_at = reset
+            if response.status_code == 429:
+                self.throttled += 1
+                self.retry_after = retry_after
+            else:
+                self.throttled = 0
+                self.retry_after = 0
+
+    def backoff(self):
+        """Seconds to wait before retrying a rate limited (429) request:
+        the `Retry-After` value, or an exponential backoff if it's longer.
+        """
+        with self._lock:
+            exponential = 0.5 * 2 ** max(self.throttled - 1, 0)
+            return min(max(self.retry_after, exponential), self.max_backoff)
+
+    def wait_before_next(self, default=0):
+        """Seconds to wait before the next request of a pagination loop.
+
+        Args:
+            default (float, optional): Wait used when the API doesn't report
+            its rate limit state. Defaults to 0.
+
+        Returns:
+            float: 0 while plenty of requests remain, more (up to `max_wait`)
+            as the remaining quota runs out, and the backoff after a 429
+            response.
+        """
+        with self._lock:
+            if self.throttled:
+                return self.backoff()
+            now = time.monotonic()
+            if self.reset_at is not None and self.reset_at <= now:
+                # the quota has been reset since the last response
+                self.remaining = self.reset_at = None
+            if self.remaining is None:
+                return default
+            if self.remaining > self.low_remaining:
+                return 0
+            if self.reset_at is None:
+                return default
+            until_reset = self.reset_at - now
+            return min(until_reset / (self.remaining + 1), self.max_wait)
+
+
+def _header_number(headers, name):
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
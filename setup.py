@@ -10,14 +10,21 @@ with open('README.md') as readme_file:
 with open('HISTORY.md') as history_file:
     history = history_file.read()
 
-requirements = ['requests>=2.26.0']
+requirements = ['requests>=2.26.0', 'urllib3>=1.26.0']
+
+extras_requirements = {
+    'async': ['aiohttp>=3.7'],
+    'http2': ['httpx[http2]>=0.18'],
+    'brotli': ['brotli'],
+    'orjson': ['orjson>=3'],
+}
 
 test_requirements = ['pytest>=3', ]
 
 setup(
     author="Attila Toth",
     author_email='hello@attilatoth.dev',
-    python_requires='>=3.6',
+    python_requires='>=3.7',
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
@@ -26,7 +33,6 @@ setup(
         'Natural Language :: English',
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Topic :: Internet',
@@ -39,6 +45,7 @@ setup(
     ],
     description="Python 3 wrapper for the OpenSea NFT API",
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="MIT license",
     long_description=readme + "\n\n" + history,
     long_description_content_type="text/markdown",
@@ -0,0 +1,176 @@
+"""Tests for `opensea.async_api`, with a fake session in place of the
+network.
+"""
+
+import asyncio
+import json
+
+import pytest
+import requests
+
+pytest.importorskip("aiohttp")
+
+from opensea import utils  # noqa: E402
+from opensea.async_api import AsyncOpenseaAPI  # noqa: E402
+
+
+class FakeResponse:
+
+    def __init__(self, status, body):
+        self.status = status
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def text(self):
+        return self.body.decode()
+
+    async def read(self):
+        return self.body
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(self.status)
+
+
+class FakeSession:
+    """Returns the pages given for each endpoint, keyed by the `cursor`
+    query parameter, and records the (key, value) query parameter pairs of
+    every request. A page
+    given as an int is sent as an error response with that status.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, params=None):
+        self.requests.append((url, params))
+        endpoint = url.split("/v1/", 1)[1]
+        page = self.pages[endpoint][dict(params).get("cursor")]
+        if isinstance(page, int):
+            return FakeResponse(page, b"error")
+        return FakeResponse(200, json.dumps(page).encode())
+
+    async def close(self):
+        pass
+
+
+def run_with(pages, coro_function, **kwargs):
+    """Runs `coro_function(api)` with an `AsyncOpenseaAPI` using a fake
+    session, returns its result and the session.
+    """
+    async def main():
+        api = AsyncOpenseaAPI(**kwargs)
+        api._session = FakeSession(pages)
+        api._semaphore = asyncio.Semaphore(api.concurrency)
+        return await coro_function(api), api._session
+
+    return asyncio.run(main())
+
+
+def test_events_query_matches_sync_client():
+    occurred_after = utils.datetime_utc(2021, 10, 5, 3, 0)
+    result, session = run_with(
+        {"events": {None: {"asset_events": []}}},
+        lambda api: api.events(collection_slug="punks",
+                               occurred_after=occurred_after))
+    assert result == {"asset_events": []}
+    _, params = session.requests[0]
+    assert dict(params) == {
+        "collection_slug": "punks",
+        "only_opensea": "False",
+        "limit": 300,
+        "occurred_after": int(occurred_after.timestamp()),
+    }
+
+
+def test_assets_expands_list_params():
+    _, session = run_with(
+        {"assets": {None: {"assets": []}}},
+        lambda api: api.assets(token_ids=[1, 2], order_by=""))
+    _, params = session.requests[0]
+    assert params == [("token_ids", 1), ("token_ids", 2),
+                      ("limit", 50), ("include_orders", "False")]
+
+
+def test_asset_listings_endpoint():
+    _, session = run_with(
+        {"asset/0xabc/1/listings": {None: {"listings": []}}},
+        lambda api: api.listings("0xabc", 1))
+    url, params = session.requests[0]
+    assert url == "https://api.opensea.io/api/v1/asset/0xabc/1/listings"
+    assert params == [("limit", 50)]
+
+
+def events_page(created_date, next_cursor):
+    return {"asset_events": [{"created_date": created_date}],
+            "next": next_cursor}
+
+
+START = utils.datetime_utc(2021, 10, 5, 3, 30)
+
+
+async def collect(pages):
+    return [page async for page in pages]
+
+
+def test_events_backfill_stops_at_until_without_prefetching_past_it():
+    until = utils.datetime_utc(2021, 10, 5, 3, 20)
+    pages, session = run_with(
+        {"events": {
+            None: events_page("2021-10-05T03:29:00", "1"),
+            "1": events_page("2021-10-05T03:25:00", "2"),
+            "2": events_page("2021-10-05T03:15:00", "3"),
+            "3": events_page("2021-10-05T03:10:00", None),
+        }},
+        lambda api: collect(api.events_backfill(START, until,
+                                                rate_limiting=0)))
+    assert len(pages) == 2
+    assert len(session.requests) == 3
+
+
+def test_events_backfill_ends_when_pages_run_out():
+    until = utils.datetime_utc(2020, 1, 1, 0, 0)
+    pages, session = run_with(
+        {"events": {
+            None: events_page("2021-10-05T03:29:00", "1"),
+            "1": events_page("2021-10-05T03:25:00", None),
+        }},
+        lambda api: collect(api.events_backfill(START, until,
+                                                rate_limiting=0)))
+    assert len(pages) == 2
+    assert len(session.requests) == 2
+
+
+def test_events_backfill_requires_datetimes():
+    with pytest.raises(ValueError):
+        run_with({}, lambda api: collect(
+            api.events_backfill(START, "2021-10-05", rate_limiting=0)))
+
+
+@pytest.mark.parametrize("status, exception, message", [
+    (400, ValueError, "error"),
+    (401, requests.exceptions.HTTPError, "error"),
+    (403, ConnectionError, "blocked"),
+    (495, requests.exceptions.SSLError, "SSL"),
+])
+def test_error_statuses_raise_like_sync_client(status, exception, message):
+    with pytest.raises(exception, match=message):
+        run_with({"collection/punks": {None: status}},
+                 lambda api: api.collection("punks"))
+
+
+@pytest.mark.parametrize("status, exception", [
+    (429, ConnectionError),
+    (504, TimeoutError),
+])
+def test_retried_statuses_raise_after_last_retry(status, exception):
+    with pytest.raises(exception):
+        run_with({"collection/punks": {None: status}},
+                 lambda api: api.collection("punks"),
+                 max_retries=1, backoff_factor=0)
@@ -0,0 +1,34 @@
+"""Tests for the lazy imports of the `opensea` package."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import opensea
+
+
+def test_import_does_not_load_requests():
+    code = "import sys, opensea; print('requests' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], check=True,
+                            capture_output=True, text=True,
+                            cwd=Path(__file__).parents[1]).stdout
+    assert output.strip() == "False"
+
+
+def test_api_classes_are_resolved_on_access():
+    from opensea.opensea import Events
+    from opensea.opensea_api import OpenseaAPI
+
+    assert opensea.OpenseaAPI is OpenseaAPI
+    assert opensea.Events is Events
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError):
+        opensea.Missing
+
+
+def test_dir_lists_lazy_names():
+    assert set(opensea.__all__) <= set(dir(opensea))
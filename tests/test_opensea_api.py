@@ -0,0 +1,260 @@
+"""Tests for `opensea.opensea_api`, with a fake session in place of the
+network.
+"""
+
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from opensea import OpenseaAPI, utils
+from opensea.opensea_api import _httpx_params
+
+
+class FakeSession:
+    """Returns the pages given for each endpoint, keyed by the `cursor` (or
+    `offset`) query parameter, and records the parameters of every request.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, params=None, stream=False, timeout=None):
+        params = dict(params or {})
+        self.requests.append((url, params))
+        endpoint = url.split("/v1/", 1)[1]
+        body = self.pages[endpoint][params.get("cursor",
+                                               params.get("offset"))]
+        content = json.dumps(body).encode()
+        return SimpleNamespace(status_code=200, headers={}, content=content,
+                               raw=io.BytesIO(content), close=lambda: None)
+
+    def close(self):
+        pass
+
+
+def api_with(pages, **kwargs):
+    api = OpenseaAPI(**kwargs)
+    api._session = FakeSession(pages)
+    return api
+
+
+def events_page(created_date, next_cursor):
+    return {"asset_events": [{"created_date": created_date}],
+            "next": next_cursor}
+
+
+START = utils.datetime_utc(2021, 10, 5, 3, 30)
+
+
+def test_events_backfill_stops_at_until():
+    api = api_with({"events": {
+        None: events_page("2021-10-05T03:29:00", "1"),
+        "1": events_page("2021-10-05T03:25:00.500000", "2"),
+        "2": events_page("2021-10-05T03:15:00", "3"),
+    }})
+    until = utils.datetime_utc(2021, 10, 5, 3, 20)
+    pages = list(api.events_backfill(START, until, rate_limiting=0))
+    assert len(pages) == 2
+    assert len(api.session.requests) == 3
+
+
+def test_events_backfill_ends_when_pages_run_out():
+    api = api_with({"events": {
+        None: events_page("2021-10-05T03:29:00", "1"),
+        "1": events_page("2021-10-05T03:25:00", None),
+    }})
+    until = utils.datetime_utc(2020, 1, 1, 0, 0)
+    pages = list(api.events_backfill(START, until, rate_limiting=0))
+    assert len(pages) == 2
+    assert len(api.session.requests) == 2
+
+
+def test_events_backfill_ends_at_empty_page():
+    api = api_with({"events": {
+        None: events_page("2021-10-05T03:29:00", "1"),
+        "1": {"asset_events": [], "next": "2"},
+    }})
+    until = utils.datetime_utc(2020, 1, 1, 0, 0)
+    pages = list(api.events_backfill(START, until, rate_limiting=0))
+    assert len(pages) == 1
+
+
+def test_events_send_integer_timestamps():
+    api = api_with({"events": {
+        None: events_page("2021-10-05T03:29:00", None),
+    }})
+    until = utils.datetime_utc(2021, 10, 5, 3, 0)
+    list(api.events_backfill(START, until, rate_limiting=0))
+    api.events(occurred_after=until)
+    backfill_params, events_params = (params for _, params
+                                      in api.session.requests)
+    assert backfill_params["occurred_before"] == int(START.timestamp())
+    assert events_params["occurred_after"] == int(until.timestamp())
+
+
+def test_export_file_is_streamed_to_disk(tmp_path):
+    page = events_page("2021-10-05T03:29:00", None)
+    api = api_with({"events": {None: page}})
+    export = tmp_path / "events.json"
+    assert api.events(export_file_name=str(export)) == page
+    assert json.loads(export.read_bytes()) == page
+
+
+def test_cached_results_are_copies():
+    api = api_with({"collection/x": {None: {"name": "x"}}})
+    api.collection("x")["name"] = "mutated"
+    assert api.collection("x") == {"name": "x"}
+    assert len(api.session.requests) == 1
+
+
+class GetSetCache:
+    """Minimal custom cache backend, without `clear()`."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = []
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl):
+        self.ttls.append(ttl)
+        self.data[key] = value
+
+
+def test_injected_cache_gets_configured_ttl():
+    cache = GetSetCache()
+    api = api_with({"collection/x": {None: {}},
+                    "asset_contract/0x": {None: {}},
+                    "collection/x/stats": {None: {}}},
+                   cache_ttl=10, cache=cache)
+    api.collection("x")
+    api.contract("0x")
+    api.collection_stats("x")
+    assert cache.ttls == [10, OpenseaAPI.CONTRACT_CACHE_TTL,
+                          OpenseaAPI.COLLECTION_STATS_CACHE_TTL]
+
+
+def test_clear_cache_skips_backends_without_clear():
+    cache = GetSetCache()
+    api = api_with({"collection/x": {None: {"name": "x"}}}, cache=cache)
+    assert api.collection("x") == {"name": "x"}
+    api.clear_cache()
+    assert api.collection("x") == {"name": "x"}
+    assert len(api.session.requests) == 1
+
+
+@pytest.mark.parametrize("param", ["limit", "pagination", "export_file_name"])
+def test_assets_by_ids_rejects_batching_params(param):
+    api = api_with({})
+    with pytest.raises(TypeError):
+        api.assets_by_ids([1, 2], **{param: 1})
+
+
+def collections_page(count):
+    return {"collections": [{"slug": str(i)} for i in range(count)]}
+
+
+def test_paginate_stops_at_short_page():
+    api = api_with({"collections": {
+        0: collections_page(2),
+        2: collections_page(2),
+        4: collections_page(1),
+    }})
+    pages = list(api.paginate("collections", page_size=2))
+    assert [len(page["collections"]) for page in pages] == [2, 2, 1]
+    offsets = [params["offset"] for _, params in api.session.requests]
+    assert offsets == [0, 2, 4]
+
+
+def test_paginate_stops_at_page_without_items():
+    api = api_with({"collections": {
+        0: collections_page(2),
+        2: {},
+    }})
+    pages = list(api.paginate("collections", page_size=2))
+    assert pages == [collections_page(2), {}]
+
+
+@pytest.mark.parametrize("param",
+                         ["offset", "limit", "pagination", "export_file_name"])
+def test_paginate_rejects_pagination_params(param):
+    api = api_with({})
+    with pytest.raises(TypeError):
+        next(api.paginate("assets", **{param: 1}))
+
+
+@pytest.mark.parametrize("page_size", [0, -1])
+def test_paginate_rejects_non_positive_page_size(page_size):
+    api = api_with({})
+    with pytest.raises(ValueError):
+        next(api.paginate("assets", page_size=page_size))
+
+
+def http2_api_with(handler):
+    httpx = pytest.importorskip("httpx")
+    api = OpenseaAPI()
+    api._http2 = True
+    api._session = httpx.Client(transport=httpx.MockTransport(handler))
+    return api
+
+
+def test_httpx_params_sends_booleans_like_requests():
+    params = {"only_opensea": True, "include_orders": False, "limit": 1}
+    assert _httpx_params(params) == {"only_opensea": "True",
+                                     "include_orders": "False", "limit": 1}
+    assert _httpx_params(None) is None
+
+
+def test_http2_requests_match_requests_query_string(tmp_path):
+    httpx = pytest.importorskip("httpx")
+    page = events_page("2021-10-05T03:29:00", None)
+    queries = []
+
+    def handler(request):
+        queries.append(dict(request.url.params))
+        return httpx.Response(200, json=page)
+
+    api = http2_api_with(handler)
+    assert api.events(only_opensea=True) == page
+    export = tmp_path / "events.json"
+    assert api.events(export_file_name=str(export)) == page
+    assert json.loads(export.read_bytes()) == page
+    assert queries[0]["only_opensea"] == "True"
+
+
+def test_http2_streamed_error_raises(tmp_path):
+    httpx = pytest.importorskip("httpx")
+    api = http2_api_with(lambda request: httpx.Response(400, text="bad"))
+    with pytest.raises(ValueError, match="bad"):
+        api.events(export_file_name=str(tmp_path / "events.json"))
+
+
+@pytest.mark.parametrize("status_code, exception", [
+    (400, ValueError),
+    (401, requests.exceptions.HTTPError),
+    (403, ConnectionError),
+    (429, ConnectionError),
+    (495, requests.exceptions.SSLError),
+    (504, TimeoutError),
+])
+def test_raise_for_status_maps_error_codes(status_code, exception):
+    response = SimpleNamespace(status_code=status_code, text="error")
+    with pytest.raises(exception):
+        OpenseaAPI._raise_for_status(response)
+
+
+@pytest.mark.parametrize("status_code", [200, 404, 500])
+def test_raise_for_status_ignores_unmapped_codes(status_code):
+    response = SimpleNamespace(status_code=status_code, text="")
+    OpenseaAPI._raise_for_status(response)
+
+
+def test_raise_for_status_passes_on_bad_request_message():
+    response = SimpleNamespace(status_code=400, text="invalid limit")
+    with pytest.raises(ValueError, match="invalid limit"):
+        OpenseaAPI._raise_for_status(response)
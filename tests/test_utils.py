@@ -0,0 +1,129 @@
+"""Tests for `opensea.utils`."""
+
+import io
+import threading
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from opensea import utils
+
+
+def response(status_code=200, **headers):
+    return SimpleNamespace(status_code=status_code, headers=headers)
+
+
+def test_compact_drops_none_and_empty_lists():
+    params = {"a": None, "b": [], "d": False, "e": 0, "f": [1]}
+    assert utils.compact(params) == {"d": False, "e": 0, "f": [1]}
+
+
+def test_compact_drops_empty_strings():
+    assert utils.compact({"a": "", "b": "x"}) == {"b": "x"}
+
+
+def test_export_file_streaming_copies_in_chunks(tmp_path):
+    content = b'{"assets": []}' * 100
+    export = tmp_path / "export.json"
+    utils.export_file_streaming(io.BytesIO(content), str(export),
+                                chunk_size=7)
+    assert export.read_bytes() == content
+
+
+@pytest.mark.parametrize("value", [
+    "2021-10-05T03:25:00.123456",
+    "2021-10-05T03:25:00.123",
+    "2021-10-05T03:25:00",
+    "2021-10-05 03:25:00.500000",
+    "2021-10-05T03:25:00+00:00",
+    "2021-10-05",
+])
+def test_str_to_datetime_utc_matches_fromisoformat(value):
+    expected = datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+    assert utils.str_to_datetime_utc(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "2023/01/01X00:00:00",
+    "2023-01-01T 0:00:00",
+    "+023-01-01T00:00:00",
+    "2023-01-01T00:00:00.1_234",
+    "2023-13-01T00:00:00",
+])
+def test_str_to_datetime_utc_rejects_malformed_strings(value):
+    with pytest.raises(ValueError):
+        utils.str_to_datetime_utc(value)
+
+
+def test_rate_controller_uses_default_without_headers():
+    rate = utils.RateController()
+    rate.update(response())
+    assert rate.wait_before_next(2) == 2
+
+
+def test_rate_controller_does_not_wait_with_plenty_remaining():
+    rate = utils.RateController(low_remaining=5)
+    rate.update(response(**{"X-RateLimit-Remaining": "100",
+                            "X-RateLimit-Reset": "30"}))
+    assert rate.remaining == 100
+    assert rate.wait_before_next(2) == 0
+
+
+def test_rate_controller_spreads_low_quota_until_reset():
+    rate = utils.RateController(low_remaining=5)
+    rate.update(response(**{"X-RateLimit-Remaining": "3",
+                            "X-RateLimit-Reset": "8"}))
+    assert rate.wait_before_next(2) == pytest.approx(2, abs=0.1)
+
+
+@pytest.mark.parametrize("scale", [1, 1000])
+def test_rate_controller_accepts_epoch_reset(scale):
+    rate = utils.RateController()
+    reset = (time.time() + 30) * scale
+    rate.update(response(**{"X-RateLimit-Remaining": "0",
+                            "X-RateLimit-Reset": str(reset)}))
+    assert rate.wait_before_next() == pytest.approx(30, abs=1)
+
+
+def test_rate_controller_wait_is_capped():
+    rate = utils.RateController(max_wait=10)
+    rate.update(response(**{"X-RateLimit-Remaining": "0",
+                            "X-RateLimit-Reset": "3600"}))
+    assert rate.wait_before_next() == 10
+
+
+def test_rate_controller_backoff_follows_retry_after():
+    rate = utils.RateController()
+    rate.update(response(429, **{"Retry-After": "7"}))
+    assert rate.backoff() == 7
+    assert rate.wait_before_next(2) == 7
+
+
+def test_rate_controller_backoff_is_exponential_and_capped():
+    rate = utils.RateController(max_backoff=3)
+    backoffs = []
+    for _ in range(5):
+        rate.update(response(429))
+        backoffs.append(rate.backoff())
+    assert backoffs == [0.5, 1, 2, 3, 3]
+
+    rate.update(response())
+    assert rate.throttled == 0
+    assert rate.wait_before_next(2) == 2
+
+
+def test_rate_controller_counts_throttling_across_threads():
+    rate = utils.RateController()
+
+    def throttle():
+        for _ in range(500):
+            rate.update(response(429))
+
+    threads = [threading.Thread(target=throttle) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert rate.throttled == 4000